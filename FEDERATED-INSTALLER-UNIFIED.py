@@ -37,8 +37,51 @@ import subprocess
 import sys
 import shutil
 import platform
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Per-tool ceilings (seconds) for subprocesses, so a hung network call
+# fails its own MCP instead of stalling the whole install
+TOOL_TIMEOUTS = {
+    'git': 180,
+    'npm': 300,
+    'pip': 900,
+}
+
+# Wrapper scripts that point an MCP at the unified database before launching it
+WINDOWS_WRAPPER_TEMPLATE = """@echo off
+set MCP_DATABASE={db_path}
+set DATABASE_URL=sqlite:///{db_path}
+set SQLITE_PATH={db_path}
+set MCP_UNIFIED=true
+{command} {args} %*
+"""
+
+UNIX_WRAPPER_TEMPLATE = """#!/bin/bash
+export MCP_DATABASE="{db_path}"
+export DATABASE_URL="sqlite:///{db_path}"
+export SQLITE_PATH="{db_path}"
+export MCP_UNIFIED="true"
+{command} {args} "$@"
+"""
+
+def read_json(path):
+    """Parse a JSON file, using orjson when it is installed"""
+    data = Path(path).read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def pretty_json(obj):
+    """Serialize to 2-space indented JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
 
 # Fix Windows Unicode
 if platform.system() == "Windows":
@@ -54,29 +97,64 @@ class FederatedUnifiedInstaller:
     3. Maintains updateability from upstream
     """
 
-    def __init__(self):
+    def __init__(self, prewarm=False):
+        # Platform facts are looked up once and reused everywhere
+        self.system = platform.system()
+        self.is_windows = self.system == "Windows"
+        self.python_cmd = 'python' if self.is_windows else 'python3'
+
         self.home = Path.home()
         self.base_dir = self.home / "mcp-servers"
         self.config_path = self._get_config_path()
         self.db_path = self.base_dir / "mcp-unified.db"
         self.wrapper_dir = self.base_dir / "federation-wrappers"
-        self.is_windows = platform.system() == "Windows"
 
-        # MCPs that benefit from unified database
-        self.UNIFIED_DB_MCPS = [
+        # MCPs that benefit from unified database (membership-checked per MCP)
+        self.UNIFIED_DB_MCPS = frozenset([
             'memory',
             'kimi-k2-code-context',
             'kimi-k2-resilient',
             'rag-context'
-        ]
+        ])
+
+        # Source matrix, built on first use
+        self.mcp_source_matrix = None
 
         # Track installation
         self.installed_mcps = []
         self.failed_mcps = []
 
+        # Globally installed npm packages, listed once on first use
+        self.global_npm_packages = None
+
+        # Clones overlap freely, but dependency builds on the worker pool are
+        # CPU and disk heavy and share npm's cache lock, so cap how many run at once
+        self.build_slots = threading.BoundedSemaphore(4)
+
+        # npm MCPs installed together by install_npm_mcps_batch
+        self.npm_batch_installed = set()
+
+        # Python dependencies are collected per MCP and installed in one pip run;
+        # each MCP's own pip arguments are kept for a per-MCP retry
+        self.pip_packages = []
+        self.pip_requirement_files = []
+        self.pip_mcp_args = {}
+
+        # Dependency fingerprints of MCPs installed by earlier runs; an MCP
+        # whose fingerprint hasn't changed skips its dependency install
+        self.deps_cache_path = self.base_dir / "deps_cache.json"
+        self.deps_cache = self.load_deps_cache()
+        self.pending_pip_deps = {}
+
         # Installation manifest for safe uninstallation
         self.manifest_path = self.base_dir / "installation_manifest.json"
 
+        # Optionally pre-fetch npx packages so first launch doesn't download them
+        self.prewarm = prewarm
+
+        # Monotonic clock: immune to NTP adjustments during a long install
+        self.start_time = time.perf_counter()
+
     def check_installation_location(self):
         """Prevent nested directory creation bug"""
         current_dir = Path.cwd()
@@ -88,7 +166,7 @@ class FederatedUnifiedInstaller:
             print("="*70)
             print("\n❌ Do NOT clone again - this would create nested directories")
             print("✅ You're in the right place - run the installer directly:")
-            print(f"   {'python' if self.is_windows else 'python3'} FEDERATED-INSTALLER-UNIFIED.py")
+            print(f"   {self.python_cmd} FEDERATED-INSTALLER-UNIFIED.py")
             print("")
             return True  # OK to proceed with installation
 
@@ -99,7 +177,7 @@ class FederatedUnifiedInstaller:
             print("="*70)
             print("\nChange to that directory first:")
             print("   cd mcp-federation-core")
-            print(f"   {'python' if self.is_windows else 'python3'} FEDERATED-INSTALLER-UNIFIED.py")
+            print(f"   {self.python_cmd} FEDERATED-INSTALLER-UNIFIED.py")
             print("")
             return False  # Don't proceed
 
@@ -112,7 +190,7 @@ class FederatedUnifiedInstaller:
             print(f"   {current_dir}")
             print("\nNavigate to the root mcp-federation-core directory:")
             print("   cd ../..")
-            print(f"   {'python' if self.is_windows else 'python3'} FEDERATED-INSTALLER-UNIFIED.py")
+            print(f"   {self.python_cmd} FEDERATED-INSTALLER-UNIFIED.py")
             print("")
             return False  # Don't proceed
 
@@ -120,9 +198,9 @@ class FederatedUnifiedInstaller:
 
     def _get_config_path(self):
         """Get Claude Desktop config path"""
-        if platform.system() == "Windows":
+        if self.is_windows:
             return Path(os.environ.get('APPDATA', '')) / "Claude" / "claude_desktop_config.json"
-        elif platform.system() == "Darwin":
+        elif self.system == "Darwin":
             return self.home / "Library" / "Application Support" / "Claude" / "claude_desktop_config.json"
         else:
             return self.home / ".config" / "Claude" / "claude_desktop_config.json"
@@ -137,23 +215,17 @@ class FederatedUnifiedInstaller:
         if self.is_windows:
             # Windows batch wrapper
             wrapper_path = self.wrapper_dir / f"{mcp_name}-wrapper.bat"
-            wrapper_content = f"""@echo off
-set MCP_DATABASE={self.db_path}
-set DATABASE_URL=sqlite:///{self.db_path}
-set SQLITE_PATH={self.db_path}
-set MCP_UNIFIED=true
-{original_config['command']} {' '.join(original_config['args'])} %*
-"""
+            template = WINDOWS_WRAPPER_TEMPLATE
         else:
             # Unix shell wrapper
             wrapper_path = self.wrapper_dir / f"{mcp_name}-wrapper.sh"
-            wrapper_content = f"""#!/bin/bash
-export MCP_DATABASE="{self.db_path}"
-export DATABASE_URL="sqlite:///{self.db_path}"
-export SQLITE_PATH="{self.db_path}"
-export MCP_UNIFIED="true"
-{original_config['command']} {' '.join(original_config['args'])} "$@"
-"""
+            template = UNIX_WRAPPER_TEMPLATE
+
+        wrapper_content = template.format(
+            db_path=self.db_path,
+            command=original_config['command'],
+            args=' '.join(original_config['args'])
+        )
 
         wrapper_path.write_text(wrapper_content)
         if not self.is_windows:
@@ -172,10 +244,9 @@ export MCP_UNIFIED="true"
         if name in self.UNIFIED_DB_MCPS:
             print(f"  🔗 Configuring {name} for unified database")
 
-            # First try environment variables (cleanest approach)
-            if 'env' not in config:
-                config['env'] = {}
-
+            # First try environment variables (cleanest approach).
+            # Copy env so the shared source matrix is left untouched
+            config['env'] = dict(config.get('env', {}))
             config['env'].update({
                 'MCP_DATABASE': str(self.db_path),
                 'DATABASE_URL': f'sqlite:///{self.db_path}',
@@ -200,9 +271,13 @@ export MCP_UNIFIED="true"
 
     def get_mcp_source_matrix(self):
         """
-        Complete source matrix with database unification info
+        Complete source matrix with database unification info.
+        Built once per installer; callers must not mutate it
         """
-        return {
+        if self.mcp_source_matrix is not None:
+            return self.mcp_source_matrix
+
+        self.mcp_source_matrix = {
             # NPM MCPs with env var support
             'sequential-thinking': {
                 'type': 'npm',
@@ -345,7 +420,7 @@ export MCP_UNIFIED="true"
                 'install': [],  # Python server - no npm install needed
                 'needs_db': True,  # UNIFIED with wrapper
                 'config': {
-                    'command': 'python' if self.is_windows else 'python3',
+                    'command': self.python_cmd,
                     'args': [str(self.base_dir / 'kimi-k2-code-context-enhanced' / 'server.py')]
                 }
             },
@@ -356,7 +431,7 @@ export MCP_UNIFIED="true"
                 'install': [],  # Python server - no npm install needed
                 'needs_db': True,  # UNIFIED with wrapper
                 'config': {
-                    'command': 'python' if self.is_windows else 'python3',
+                    'command': self.python_cmd,
                     'args': [str(self.base_dir / 'kimi-k2-resilient-enhanced' / 'server.py')]
                 }
             },
@@ -367,12 +442,13 @@ export MCP_UNIFIED="true"
                 'install': [],  # Python server - no npm install needed
                 'needs_db': True,  # UNIFIED
                 'config': {
-                    'command': 'python' if self.is_windows else 'python3',
+                    'command': self.python_cmd,
                     'args': [str(self.base_dir / 'rag-context-fixed' / 'server.py')],
                     'timeout': 120000
                 }
             }
         }
+        return self.mcp_source_matrix
 
     def initialize_unified_database(self):
         """
@@ -439,16 +515,73 @@ export MCP_UNIFIED="true"
             print(f"  ⚠️ Could not initialize database: {e}")
             return False
 
+    def get_global_npm_packages(self):
+        """List globally installed npm packages with a single npm call per run"""
+        if self.global_npm_packages is None:
+            try:
+                result = subprocess.run(['npm', 'ls', '-g', '--depth=0', '--json'],
+                                        capture_output=True, text=True, shell=self.is_windows,
+                                        timeout=TOOL_TIMEOUTS['npm'])
+                # npm ls exits non-zero on peer-dependency warnings but still prints the tree
+                self.global_npm_packages = json.loads(result.stdout or '{}').get('dependencies', {})
+            except (OSError, ValueError, subprocess.TimeoutExpired):
+                self.global_npm_packages = {}
+
+        return self.global_npm_packages
+
+    def is_npm_package_installed(self, spec):
+        """Check an npm spec like 'pkg', '@scope/pkg' or 'pkg@1.2.3' against the global packages"""
+        version_at = spec.find('@', 1)
+        package, version = (spec[:version_at], spec[version_at + 1:]) if version_at > 0 else (spec, None)
+
+        installed = self.get_global_npm_packages().get(package)
+        if installed is None:
+            return False
+
+        # Dist-tags such as 'latest' only match by exact version, so they get refreshed
+        return version is None or installed.get('version') == version
+
+    def install_npm_mcps_batch(self, npm_mcps):
+        """
+        Install every missing npm MCP with a single 'npm install -g' call.
+        If the batch fails, nothing is recorded and each MCP falls back to
+        its own install in install_npm_mcp, which isolates the bad package
+        """
+        missing = {name: info['source'] for name, info in npm_mcps.items()
+                   if not self.is_npm_package_installed(info['source'])}
+        if len(missing) < 2:
+            return
+
+        print(f"\n📦 Installing {len(missing)} npm MCPs in one batch...")
+        try:
+            result = subprocess.run(
+                ['npm', 'install', '-g', *missing.values()],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=TOOL_TIMEOUTS['npm'] * len(missing),
+                shell=self.is_windows
+            )
+        except Exception as e:
+            print(f"  ⚠️ Batch install failed, installing individually: {e}")
+            return
+
+        if result.returncode != 0:
+            print(f"  ⚠️ Batch install failed, installing individually")
+            return
+
+        self.npm_batch_installed.update(missing)
+
     def install_npm_mcp(self, name, mcp_info):
         """Install MCP from npm registry"""
         print(f"\n📦 Installing {name} from npm...")
 
         try:
-            # Check if already installed
-            check_cmd = ['npm', 'list', '-g', mcp_info['source']]
-            result = subprocess.run(check_cmd, capture_output=True, text=True, shell=self.is_windows)
+            if name in self.npm_batch_installed:
+                print(f"  ✅ Installed: {name}")
+                return True
 
-            if result.returncode == 0:
+            # Check if already installed
+            if self.is_npm_package_installed(mcp_info['source']):
                 print(f"  ✓ Already installed: {mcp_info['source']}")
                 return True
 
@@ -456,8 +589,10 @@ export MCP_UNIFIED="true"
             print(f"  Installing: {mcp_info['source']}")
             install_result = subprocess.run(
                 mcp_info['install'],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
+                timeout=TOOL_TIMEOUTS['npm'],
                 shell=self.is_windows
             )
 
@@ -472,10 +607,126 @@ export MCP_UNIFIED="true"
             print(f"  ❌ Error: {e}")
             return False
 
-    def install_federation_mcp(self, name, mcp_info):
-        """Copy federation MCP from bundled sources"""
-        print(f"\n📦 Installing {name} from bundled sources...")
+    def load_deps_cache(self):
+        """Load dependency fingerprints recorded by previous installs"""
+        try:
+            return read_json(self.deps_cache_path)
+        except (OSError, ValueError):
+            return {}
+
+    def save_deps_cache(self):
+        """Persist dependency fingerprints for the next run"""
+        try:
+            self.deps_cache_path.write_bytes(pretty_json(self.deps_cache))
+        except OSError as e:
+            print(f"  ⚠️ Could not save dependency cache: {e}")
+
+    def get_deps_fingerprint(self, mcp_info, mcp_dir):
+        """
+        Identify an MCP's dependency set: checkout HEAD, requirements.txt
+        mtime, install command and, for pip installs, the target interpreter
+        """
+        head = None
+        if (mcp_dir / '.git').exists():
+            result = subprocess.run(['git', '-C', str(mcp_dir), 'rev-parse', 'HEAD'],
+                                    capture_output=True, text=True, timeout=TOOL_TIMEOUTS['git'])
+            head = result.stdout.strip() or None
+
+        try:
+            req_mtime = (mcp_dir / 'requirements.txt').stat().st_mtime
+        except OSError:
+            req_mtime = None
+
+        fingerprint = {'head': head, 'req_mtime': req_mtime, 'install': mcp_info['install']}
+        if mcp_info['install'] and mcp_info['install'][0] == 'pip':
+            fingerprint['python'] = sys.executable
+        return fingerprint
+
+    def queue_pip_dependencies(self, name, packages, mcp_dir):
+        """
+        Queue an MCP's Python dependencies (the listed packages plus its
+        requirements.txt when it ships one) for install_python_dependencies
+        """
+        requirements_file = Path(mcp_dir) / 'requirements.txt'
+        try:
+            lines = requirements_file.read_text(encoding='utf-8').splitlines()
+        except OSError:
+            lines = []
+
+        # Plain specifier lines are merged with every other MCP's so shared
+        # dependencies appear once; files using pip options or relative
+        # paths are passed to pip as-is
+        requirements = [line.split(' #', 1)[0].strip() for line in lines
+                        if line.strip() and not line.lstrip().startswith('#')]
+        if any(requirement.startswith(('-', '.')) for requirement in requirements):
+            self.pip_requirement_files.append(requirements_file)
+            self.pip_mcp_args[name] = [*packages, '-r', str(requirements_file)]
+            requirements = []
+        else:
+            self.pip_mcp_args[name] = [*packages, *requirements]
+
+        for package in [*packages, *requirements]:
+            if package not in self.pip_packages:
+                self.pip_packages.append(package)
+
+    def run_pip_install(self, args):
+        """Run '<python> -m pip install' with args; returns (success, stderr)"""
+        pip_cmd = [sys.executable, '-m', 'pip', 'install', '--disable-pip-version-check', '--prefer-binary',
+                   *args]
+
+        env = os.environ.copy()
+        env['PIP_NO_INPUT'] = '1'
+
+        result = subprocess.run(pip_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                text=True, env=env, timeout=TOOL_TIMEOUTS['pip'])
+        return result.returncode == 0, result.stderr
+
+    def install_python_dependencies(self):
+        """Install the queued Python dependencies of all MCPs with a single pip invocation"""
+        if not self.pip_packages and not self.pip_requirement_files:
+            return True
+
+        print("\n🐍 Installing Python dependencies...")
 
+        pip_args = list(self.pip_packages)
+        for requirements_file in self.pip_requirement_files:
+            pip_args.extend(['-r', str(requirements_file)])
+
+        try:
+            installed, stderr = self.run_pip_install(pip_args)
+        except Exception as e:
+            installed, stderr = False, str(e)
+
+        if installed:
+            print(f"  ✅ Python dependencies installed")
+            self.deps_cache.update(self.pending_pip_deps)
+            return True
+
+        # One bad requirement fails the whole batch; retry MCP by MCP so only
+        # the MCP that owns it goes without its dependencies
+        print(f"  ⚠️ Combined pip install failed, retrying per MCP: {stderr[:200]}")
+        all_installed = True
+        for name, args in self.pip_mcp_args.items():
+            try:
+                installed, stderr = self.run_pip_install(args)
+            except Exception as e:
+                installed, stderr = False, str(e)
+
+            if installed:
+                print(f"  ✅ {name}: Python dependencies installed")
+                if name in self.pending_pip_deps:
+                    self.deps_cache[name] = self.pending_pip_deps[name]
+            else:
+                print(f"  ⚠️ {name}: pip install had warnings: {stderr[:200]}")
+                all_installed = False
+
+        return all_installed
+
+    def prepare_federation_mcp(self, name, mcp_info):
+        """
+        Copy a federation MCP from bundled sources and run its npm install.
+        Runs on a worker thread: returns (success, messages)
+        """
         # Get paths
         script_dir = Path(__file__).parent
         source_dir = script_dir / mcp_info['source_directory']
@@ -484,33 +735,52 @@ export MCP_UNIFIED="true"
         try:
             # Check if source exists
             if not source_dir.exists():
-                print(f"  ❌ Source directory not found: {source_dir}")
-                return False
+                return False, [f"  ❌ Source directory not found: {source_dir}"]
 
             # Copy federation MCP
             if target_dir.exists():
                 shutil.rmtree(target_dir)
 
             shutil.copytree(source_dir, target_dir)
-            print(f"  ✅ Federation MCP copied successfully")
+            messages = [f"  ✅ Federation MCP copied successfully"]
 
             # Install dependencies if needed
-            if mcp_info.get('install'):
-                if mcp_info['install'][0] == 'npm':
-                    result = subprocess.run(['npm', 'install'], cwd=str(target_dir), capture_output=True, text=True)
-                    if result.returncode == 0:
-                        print(f"  ✅ npm dependencies installed")
-                    else:
-                        print(f"  ⚠️ npm install had warnings (usually OK)")
-
-                elif mcp_info['install'][0] == 'pip':
-                    pip_cmd = ['pip', 'install'] if self.is_windows else ['pip3', 'install']
-                    pip_cmd.extend(mcp_info['install'][1:])  # Add the packages
-                    result = subprocess.run(pip_cmd, capture_output=True, text=True)
-                    if result.returncode == 0:
-                        print(f"  ✅ Python dependencies installed")
-                    else:
-                        print(f"  ⚠️ pip install had warnings: {result.stderr[:100]}")
+            if mcp_info.get('install') and mcp_info['install'][0] == 'npm':
+                with self.build_slots:
+                    result = subprocess.run(['npm', 'install'], cwd=str(target_dir), stdout=subprocess.DEVNULL,
+                                            stderr=subprocess.DEVNULL, timeout=TOOL_TIMEOUTS['npm'])
+                if result.returncode == 0:
+                    messages.append(f"  ✅ npm dependencies installed")
+                else:
+                    messages.append(f"  ⚠️ npm install had warnings (usually OK)")
+
+            return True, messages
+
+        except Exception as e:
+            return False, [f"  ❌ Exception during federation installation: {e}"]
+
+    def install_federation_mcp(self, name, mcp_info, prepared=None):
+        """Copy federation MCP from bundled sources"""
+        print(f"\n📦 Installing {name} from bundled sources...")
+
+        target_dir = self.base_dir / mcp_info['directory']
+
+        try:
+            copied, messages = prepared or self.prepare_federation_mcp(name, mcp_info)
+            print("\n".join(messages))
+            if not copied:
+                return False
+
+            # pip shares one queue across MCPs, so it is fed from this thread.
+            # node_modules is wiped by every copy, site-packages is not
+            if mcp_info.get('install') and mcp_info['install'][0] == 'pip':
+                fingerprint = self.get_deps_fingerprint(mcp_info, target_dir)
+                if self.deps_cache.get(name) == fingerprint:
+                    print(f"  ✓ Python dependencies unchanged since last install")
+                else:
+                    self.queue_pip_dependencies(name, mcp_info['install'][2:], target_dir)
+                    self.pending_pip_deps[name] = fingerprint
+                    print(f"  📦 Python dependencies queued")
 
             return True
 
@@ -518,32 +788,117 @@ export MCP_UNIFIED="true"
             print(f"  ❌ Exception during federation installation: {e}")
             return False
 
-    def install_github_mcp(self, name, mcp_info):
-        """Clone and install MCP from GitHub"""
-        print(f"\n🔗 Installing {name} from GitHub...")
-
+    def fetch_github_mcp(self, name, mcp_info):
+        """
+        Clone (or update) a GitHub MCP checkout.
+        Runs on a worker thread, so it reports through its return value
+        instead of printing: (success, message)
+        """
         target_dir = self.base_dir / mcp_info['directory']
 
         try:
             if target_dir.exists():
-                print(f"  📂 Updating existing repository...")
+                # A broken checkout must not make git fall back to a repository above it
+                git_env = dict(os.environ, GIT_CEILING_DIRECTORIES=str(target_dir.parent))
                 pull_cmd = ['git', 'pull', 'origin', mcp_info['branch']]
-                subprocess.run(pull_cmd, cwd=str(target_dir), capture_output=True)
+                try:
+                    pull_result = subprocess.run(pull_cmd, cwd=str(target_dir), stdout=subprocess.DEVNULL,
+                                                 stderr=subprocess.DEVNULL, env=git_env,
+                                                 timeout=TOOL_TIMEOUTS['git'])
+                    if pull_result.returncode == 0:
+                        return True, "  📂 Updated existing repository"
+                except subprocess.TimeoutExpired:
+                    pass
+
+                # The pull failed: keep a checkout that still has a HEAD (e.g.
+                # when offline), but re-clone over a broken or half-cloned one
+                head_result = subprocess.run(['git', 'rev-parse', '--verify', 'HEAD'], cwd=str(target_dir),
+                                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                             env=git_env, timeout=TOOL_TIMEOUTS['git'])
+                if head_result.returncode == 0:
+                    return True, "  ⚠️ Could not update repository, using existing checkout"
+                shutil.rmtree(target_dir, ignore_errors=True)
+
+            # Only the tip tree is needed to run the MCP, not its history
+            clone_cmd = ['git', 'clone', '--depth=1', '--single-branch', '--filter=blob:none',
+                       '-b', mcp_info['branch'], mcp_info['source'], str(target_dir)]
+            try:
+                clone_result = subprocess.run(clone_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                              text=True, timeout=TOOL_TIMEOUTS['git'])
+
+                # Git older than 2.19 rejects --filter; a shallow clone is still fine there
+                if clone_result.returncode != 0 and 'filter' in clone_result.stderr:
+                    clone_cmd.remove('--filter=blob:none')
+                    clone_result = subprocess.run(clone_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                                  text=True, timeout=TOOL_TIMEOUTS['git'])
+            except subprocess.TimeoutExpired:
+                # A killed git can't clean up after itself; don't leave a
+                # half-clone for the next run to mistake for a checkout
+                shutil.rmtree(target_dir, ignore_errors=True)
+                return False, f"  ❌ Clone timed out after {TOOL_TIMEOUTS['git']}s"
+
+            if clone_result.returncode != 0:
+                return False, f"  ❌ Clone failed: {clone_result.stderr[:200]}"
+
+            return True, f"  Cloned: {mcp_info['source']}"
+
+        except Exception as e:
+            return False, f"  ❌ Error: {e}"
+
+    def prepare_github_mcp(self, name, mcp_info):
+        """
+        Fetch a GitHub MCP and run its non-pip dependency install straight
+        after, so one MCP's npm install overlaps the next MCP's clone.
+        Runs on a worker thread: returns (success, messages)
+        """
+        fetched, message = self.fetch_github_mcp(name, mcp_info)
+        messages = [message]
+
+        install_cmd = mcp_info['install']
+        if not fetched or not install_cmd or install_cmd[0] == 'pip':
+            return fetched, messages
+
+        target_dir = self.base_dir / mcp_info['directory']
+        try:
+            # Install dependencies, unless HEAD and requirements are unchanged
+            # and the checkout still has them (a fresh clone never does)
+            fingerprint = self.get_deps_fingerprint(mcp_info, target_dir)
+            if self.deps_cache.get(name) == fingerprint and (target_dir / 'node_modules').is_dir():
+                messages.append("  ✓ Dependencies unchanged since last install")
             else:
-                print(f"  Cloning: {mcp_info['source']}")
-                clone_cmd = ['git', 'clone', '-b', mcp_info['branch'],
-                           mcp_info['source'], str(target_dir)]
-                clone_result = subprocess.run(clone_cmd, capture_output=True, text=True)
+                messages.append("  📦 Installing dependencies...")
+                with self.build_slots:
+                    result = subprocess.run(install_cmd, cwd=str(target_dir), stdout=subprocess.DEVNULL,
+                                          stderr=subprocess.DEVNULL, shell=self.is_windows,
+                                          timeout=TOOL_TIMEOUTS.get(install_cmd[0], TOOL_TIMEOUTS['npm']))
+                if result.returncode == 0:
+                    self.deps_cache[name] = fingerprint
+        except Exception as e:
+            messages.append(f"  ⚠️ Dependency install failed: {e}")
 
-                if clone_result.returncode != 0:
-                    print(f"  ❌ Clone failed: {clone_result.stderr[:200]}")
-                    return False
+        return fetched, messages
+
+    def install_github_mcp(self, name, mcp_info, prepared=None):
+        """Clone and install MCP from GitHub"""
+        print(f"\n🔗 Installing {name} from GitHub...")
+
+        target_dir = self.base_dir / mcp_info['directory']
+
+        try:
+            fetched, messages = prepared or self.prepare_github_mcp(name, mcp_info)
+            print("\n".join(messages))
+            if not fetched:
+                return False
 
-            # Install dependencies
-            if mcp_info['install']:
-                print(f"  📦 Installing dependencies...")
-                subprocess.run(mcp_info['install'], cwd=str(target_dir),
-                             capture_output=True, shell=self.is_windows)
+            # pip shares one queue across MCPs, so it is fed from this thread
+            if mcp_info['install'] and mcp_info['install'][0] == 'pip':
+                fingerprint = self.get_deps_fingerprint(mcp_info, target_dir)
+                if self.deps_cache.get(name) == fingerprint:
+                    print(f"  ✓ Dependencies unchanged since last install")
+                else:
+                    self.queue_pip_dependencies(name, mcp_info['install'][2:], target_dir)
+                    self.pending_pip_deps[name] = fingerprint
+                    print(f"  📦 Python dependencies queued")
 
             print(f"  ✅ Ready: {name}")
             return True
@@ -559,6 +914,7 @@ export MCP_UNIFIED="true"
             return True
 
         try:
+            from datetime import datetime
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
 
             # Create backup directory
@@ -572,7 +928,12 @@ export MCP_UNIFIED="true"
             # Create 'before_federation' backup if it doesn't exist
             before_federation_path = backup_dir / 'claude_desktop_config_before_federation.json'
             if not before_federation_path.exists():
-                shutil.copy2(self.config_path, before_federation_path)
+                # Backups are never written to again, so the second one can share
+                # the first one's data instead of copying the config a second time
+                try:
+                    os.link(backup_path, before_federation_path)
+                except OSError:
+                    shutil.copy2(self.config_path, before_federation_path)
                 print(f"  💾 Created 'before_federation' backup: {before_federation_path}")
 
             print(f"  💾 Configuration backed up: {backup_path}")
@@ -588,8 +949,7 @@ export MCP_UNIFIED="true"
             return {'mcpServers': {}}
 
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                existing_config = json.load(f)
+            existing_config = read_json(self.config_path)
 
             # Ensure mcpServers key exists
             if 'mcpServers' not in existing_config:
@@ -605,17 +965,14 @@ export MCP_UNIFIED="true"
     def create_installation_manifest(self, existing_config):
         """Create manifest tracking pre-existing vs newly installed MCPs"""
         print("\n📋 Creating installation manifest...")
+        from datetime import datetime
 
         matrix = self.get_mcp_source_matrix()
         federation_mcps = set(matrix.keys())
 
         # Identify pre-existing MCPs
-        pre_existing_mcps = []
         existing_mcps = existing_config.get('mcpServers', {})
-
-        for name in existing_mcps.keys():
-            if name in federation_mcps:
-                pre_existing_mcps.append(name)
+        pre_existing_mcps = [name for name in existing_mcps if name in federation_mcps]
 
         # Create manifest
         manifest = {
@@ -628,16 +985,14 @@ export MCP_UNIFIED="true"
 
         if pre_existing_mcps:
             print(f"  ✅ Detected {len(pre_existing_mcps)} pre-existing federation MCPs:")
-            for name in pre_existing_mcps:
-                print(f"    • {name} (will be preserved)")
+            print("\n".join(f"    • {name} (will be preserved)" for name in pre_existing_mcps))
 
         return manifest
 
     def save_installation_manifest(self, manifest):
         """Save installation manifest to disk"""
         try:
-            with open(self.manifest_path, 'w', encoding='utf-8') as f:
-                json.dump(manifest, f, indent=2)
+            self.manifest_path.write_bytes(pretty_json(manifest))
             print(f"  ✅ Manifest saved: {self.manifest_path}")
             return True
         except Exception as e:
@@ -646,16 +1001,11 @@ export MCP_UNIFIED="true"
 
     def update_manifest_with_results(self, manifest):
         """Update manifest with installation results"""
-        manifest['newly_installed_mcps'] = self.installed_mcps.copy()
         manifest['failed_mcps'] = self.failed_mcps.copy()
 
         # Remove pre-existing MCPs from newly_installed list if they exist
-        newly_installed = []
-        for mcp in self.installed_mcps:
-            if mcp not in manifest['pre_existing_mcps']:
-                newly_installed.append(mcp)
-
-        manifest['newly_installed_mcps'] = newly_installed
+        pre_existing = set(manifest['pre_existing_mcps'])
+        manifest['newly_installed_mcps'] = [mcp for mcp in self.installed_mcps if mcp not in pre_existing]
 
         print(f"\n📋 Manifest summary:")
         print(f"  • Pre-existing MCPs: {len(manifest['pre_existing_mcps'])}")
@@ -668,22 +1018,21 @@ export MCP_UNIFIED="true"
         """Merge new federation MCPs with existing user MCPs"""
         print("\n🔄 Merging configurations...")
 
-        merged_config = existing_config.copy()
+        # Only mcpServers is mutated below; copy just that level so the caller's
+        # existing_config still reflects the pre-merge state for confirm_changes
+        merged_config = {**existing_config, 'mcpServers': dict(existing_config.get('mcpServers', {}))}
         matrix = self.get_mcp_source_matrix()
 
         # List of federation MCPs that we manage
         federation_mcps = set(matrix.keys())
 
         # Count existing non-federation MCPs
-        existing_user_mcps = []
-        for name in existing_config.get('mcpServers', {}).keys():
-            if name not in federation_mcps:
-                existing_user_mcps.append(name)
+        existing_user_mcps = [name for name in existing_config.get('mcpServers', {})
+                              if name not in federation_mcps]
 
         if existing_user_mcps:
             print(f"  ✅ Preserving {len(existing_user_mcps)} existing user MCPs:")
-            for name in existing_user_mcps:
-                print(f"    • {name}")
+            print("\n".join(f"    • {name}" for name in existing_user_mcps))
 
         # Add/update federation MCPs with duplicate prevention
         updated_mcps = []
@@ -754,6 +1103,37 @@ export MCP_UNIFIED="true"
             else:
                 print("Please answer 'y' for yes or 'n' for no")
 
+    def prewarm_npm_cache(self):
+        """Fetch the packages Claude Desktop launches via 'npx -y' into the npm cache"""
+        matrix = self.get_mcp_source_matrix()
+        specs = []
+        for name in self.installed_mcps:
+            config = matrix[name]['config']
+            args = config.get('args', [])
+            if config.get('command') == 'npx' and '-y' in args[:-1]:
+                spec = args[args.index('-y') + 1]
+                if spec not in specs:
+                    specs.append(spec)
+
+        if not specs:
+            return
+
+        print(f"\n📥 Pre-warming npm cache for {len(specs)} packages...")
+
+        def fetch(spec):
+            try:
+                result = subprocess.run(['npm', 'cache', 'add', spec], stdout=subprocess.DEVNULL,
+                                        stderr=subprocess.DEVNULL, timeout=TOOL_TIMEOUTS['npm'],
+                                        shell=self.is_windows)
+                return spec, result.returncode == 0
+            except (subprocess.TimeoutExpired, OSError):
+                return spec, False
+
+        # The npm registry starts rate-limiting beyond a handful of parallel fetches
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            for spec, ok in executor.map(fetch, specs):
+                print(f"  ✓ Cached: {spec}" if ok else f"  ⚠️ Could not cache: {spec}")
+
     def write_configuration_safely(self, config):
         """Write configuration with atomic file operations"""
         print("\n💾 Writing configuration safely...")
@@ -762,16 +1142,11 @@ export MCP_UNIFIED="true"
             # Write to temporary file first
             temp_path = self.config_path.with_suffix('.tmp')
 
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
-
-            # Atomic move to final location
-            if self.is_windows:
-                # Windows requires removing target file first
-                if self.config_path.exists():
-                    self.config_path.unlink()
+            temp_path.write_bytes(pretty_json(config))
 
-            temp_path.rename(self.config_path)
+            # Atomic swap - os.replace overwrites on Windows too, so the
+            # config is never missing between unlink and rename
+            os.replace(temp_path, self.config_path)
 
             print(f"  ✅ Configuration saved safely: {self.config_path}")
             return True
@@ -836,28 +1211,57 @@ export MCP_UNIFIED="true"
         # Install MCPs
         matrix = self.get_mcp_source_matrix()
 
-        for name, info in matrix.items():
-            success = False
-            if info['type'] == 'npm':
-                success = self.install_npm_mcp(name, info)
-            elif info['type'] == 'github':
-                success = self.install_github_mcp(name, info)
-            elif info['type'] == 'federation':
-                success = self.install_federation_mcp(name, info)
-
-            if success:
-                self.installed_mcps.append(name)
-            else:
-                self.failed_mcps.append(name)
+        # Clones are network-bound: start them all up front so they overlap
+        # with each other and with the npm installs below. Each worker moves
+        # on to its MCP's dependency install as soon as its clone lands.
+        # Bundled copies and their npm installs run alongside them
+        preparers = {'github': self.prepare_github_mcp, 'federation': self.prepare_federation_mcp}
+        background_mcps = {name: info for name, info in matrix.items() if info['type'] in preparers}
+        max_workers = min(len(background_mcps), (os.cpu_count() or 4) * 2) or 1
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            prepared = {name: executor.submit(preparers[info['type']], name, info)
+                        for name, info in background_mcps.items()}
+
+            # One npm resolver run for all registry MCPs instead of one per MCP
+            self.install_npm_mcps_batch({name: info for name, info in matrix.items() if info['type'] == 'npm'})
+
+            installers = {
+                'npm': self.install_npm_mcp,
+                'github': self.install_github_mcp,
+                'federation': self.install_federation_mcp
+            }
 
-        # Write configuration
-        self.write_configuration()
+            for name, info in matrix.items():
+                installer = installers.get(info['type'])
+                if installer is None:
+                    success = False
+                elif name in prepared:
+                    success = installer(name, info, prepared[name].result())
+                else:
+                    success = installer(name, info)
+
+                if success:
+                    self.installed_mcps.append(name)
+                else:
+                    self.failed_mcps.append(name)
+
+        # One resolver pass for every Python MCP instead of one per MCP
+        self.install_python_dependencies()
+        self.save_deps_cache()
+
+        # Write configuration; the cache is only worth warming if Claude
+        # Desktop will actually launch these MCPs
+        if self.write_configuration() and self.prewarm:
+            self.prewarm_npm_cache()
+
+        elapsed = time.perf_counter() - self.start_time
 
         # Summary
         print("\n" + "="*70)
         print(" INSTALLATION COMPLETE")
         print("="*70)
-        print(f"\n✅ Installed: {len(self.installed_mcps)} MCPs")
+        print(f"\n✅ Installed: {len(self.installed_mcps)} MCPs in {elapsed:.1f}s")
         print(f"   Using unified database: {len(self.UNIFIED_DB_MCPS)} MCPs")
         print(f"   Independent databases: {len(self.installed_mcps) - len(self.UNIFIED_DB_MCPS)} MCPs")
 
@@ -876,6 +1280,13 @@ export MCP_UNIFIED="true"
         return True
 
 def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='MCP Federation Core unified installer')
+    parser.add_argument('--prewarm', action='store_true',
+                        help="Pre-fetch the MCP packages launched via 'npx -y' into the npm cache")
+    args = parser.parse_args()
+
     # Display version header
     print("="*70)
     print(" MCP Federation Core v0.1.4 - COMPLETE FIX INSTALLER")
@@ -887,7 +1298,7 @@ def main():
     print("="*70)
     print()
 
-    installer = FederatedUnifiedInstaller()
+    installer = FederatedUnifiedInstaller(prewarm=args.prewarm)
     try:
         success = installer.install()
         sys.exit(0 if success else 1)
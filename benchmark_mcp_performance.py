@@ -10,6 +10,7 @@ import sqlite3
 import json
 import subprocess
 import os
+import platform
 from pathlib import Path
 
 def benchmark_database_operations():
@@ -110,7 +111,7 @@ def run_benchmarks():
     print("\n## System Information:")
     print(f"CPU Cores: {psutil.cpu_count()}")
     print(f"Total RAM: {psutil.virtual_memory().total / 1024 / 1024 / 1024:.1f} GB")
-    print(f"Python Version: {subprocess.check_output(['python', '--version']).decode().strip()}")
+    print(f"Python Version: Python {platform.python_version()}")
     print(f"Node Version: {subprocess.check_output(['node', '--version']).decode().strip()}")
     
     # Database benchmarks
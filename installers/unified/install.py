@@ -7,7 +7,6 @@ Fixes critical database path issues and eliminates hardcoded paths
 import os
 import sys
 import json
-import sqlite3
 import shutil
 import platform
 import subprocess
@@ -15,6 +14,11 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class MCPInstaller:
     def __init__(self):
         self.platform = platform.system().lower()
@@ -158,11 +162,17 @@ class MCPInstaller:
         # CRITICAL FIX: SQLite MCP must point to unified database
         unified_db_path = str(self.mcp_base / 'mcp-unified.db')
 
+        # Resolve shared prefixes once instead of per entry
+        node = self.node_exec or 'node'
+        python = self.python_exec
+        mcps_dir = self.repo_root / 'mcps'
+        node_modules = self.repo_root / 'node_modules'
+
         configs = {
             'sqlite-data-warehouse': {
-                'command': self.node_exec or 'node',
+                'command': node,
                 'args': [
-                    str(self.repo_root / 'mcps' / 'sqlite' / 'server.js'),
+                    str(mcps_dir / 'sqlite' / 'server.js'),
                     unified_db_path  # FIXED: Points to actual unified database
                 ],
                 'env': {
@@ -170,48 +180,48 @@ class MCPInstaller:
                 }
             },
             'expert-role-prompt': {
-                'command': self.node_exec or 'node',
-                'args': [str(self.repo_root / 'mcps' / 'expert-role-prompt' / 'server.js')]
+                'command': node,
+                'args': [str(mcps_dir / 'expert-role-prompt' / 'server.js')]
             },
             'kimi-k2-resilient': {
-                'command': self.python_exec,
-                'args': [str(self.repo_root / 'mcps' / 'kimi-k2-resilient-enhanced' / 'server.py')]
+                'command': python,
+                'args': [str(mcps_dir / 'kimi-k2-resilient-enhanced' / 'server.py')]
             },
             'kimi-k2-code-context': {
-                'command': self.python_exec,
-                'args': [str(self.repo_root / 'mcps' / 'kimi-k2-code-context-enhanced' / 'server.py')]
+                'command': python,
+                'args': [str(mcps_dir / 'kimi-k2-code-context-enhanced' / 'server.py')]
             },
             'converse-enhanced': {
-                'command': self.python_exec,
-                'args': [str(self.repo_root / 'mcps' / 'converse-enhanced' / 'server.py')]
+                'command': python,
+                'args': [str(mcps_dir / 'converse-enhanced' / 'server.py')]
             },
             'filesystem': {
-                'command': self.node_exec or 'node',
+                'command': node,
                 'args': [
-                    str(self.repo_root / 'node_modules' / '@modelcontextprotocol' / 'server-filesystem' / 'dist' / 'index.js'),
+                    str(node_modules / '@modelcontextprotocol' / 'server-filesystem' / 'dist' / 'index.js'),
                     str(self.home_dir / 'Documents')  # Cross-platform documents folder
                 ]
             },
             'memory': {
-                'command': self.node_exec or 'node',
-                'args': [str(self.repo_root / 'node_modules' / '@modelcontextprotocol' / 'server-memory' / 'dist' / 'index.js')]
+                'command': node,
+                'args': [str(node_modules / '@modelcontextprotocol' / 'server-memory' / 'dist' / 'index.js')]
             },
             'sequential-thinking': {
-                'command': self.node_exec or 'node',
-                'args': [str(self.repo_root / 'node_modules' / '@modelcontextprotocol' / 'server-sequential-thinking' / 'dist' / 'index.js')]
+                'command': node,
+                'args': [str(node_modules / '@modelcontextprotocol' / 'server-sequential-thinking' / 'dist' / 'index.js')]
             },
             'desktop-commander': {
-                'command': self.node_exec or 'node',
-                'args': [str(self.repo_root / 'node_modules' / '@wonderwhy-er' / 'desktop-commander' / 'dist' / 'index.js')]
+                'command': node,
+                'args': [str(node_modules / '@wonderwhy-er' / 'desktop-commander' / 'dist' / 'index.js')]
             },
             'playwright': {
-                'command': self.node_exec or 'node',
-                'args': [str(self.repo_root / 'node_modules' / '@playwright' / 'mcp' / 'dist' / 'index.js')],
+                'command': node,
+                'args': [str(node_modules / '@playwright' / 'mcp' / 'dist' / 'index.js')],
                 'env': {'PLAYWRIGHT_BROWSER': 'chromium'}
             },
             'git-ops': {
-                'command': self.node_exec or 'node',
-                'args': [str(self.repo_root / 'node_modules' / '@cyanheads' / 'git-mcp-server' / 'dist' / 'index.js')],
+                'command': node,
+                'args': [str(node_modules / '@cyanheads' / 'git-mcp-server' / 'dist' / 'index.js')],
                 'env': {'GIT_REPO_PATH': str(self.repo_root)}
             }
         }
@@ -258,8 +268,8 @@ class MCPInstaller:
 
         # Load existing config or create new
         if config_path.exists():
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            data = config_path.read_bytes()
+            config = orjson.loads(data) if orjson is not None else json.loads(data)
         else:
             config = {}
 
@@ -270,9 +280,12 @@ class MCPInstaller:
         # Add our MCP configurations
         config['mcpServers'].update(mcp_configs)
 
-        # Write back to file
-        with open(config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+        # Serialize first, then write back in a single call
+        if orjson is not None:
+            data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(config, indent=2).encode('utf-8')
+        config_path.write_bytes(data)
 
         self.logger.info(f"Configuration written to: {config_path}")
 
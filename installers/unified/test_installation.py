@@ -9,7 +9,6 @@ import sys
 import json
 import sqlite3
 import tempfile
-import shutil
 import unittest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -21,20 +20,25 @@ from install import MCPInstaller
 from db_manager import DatabaseManager
 from validator import InstallationValidator
 
+# Windows can keep a just-closed SQLite file locked briefly; don't fail a test over it
+TEMP_DIR_OPTIONS = {'ignore_cleanup_errors': True} if sys.version_info >= (3, 10) else {}
+
+def make_test_dir(test_case):
+    """Create a temporary directory that is removed when the test finishes"""
+    temp_dir = tempfile.TemporaryDirectory(**TEMP_DIR_OPTIONS)
+    test_case.addCleanup(temp_dir.cleanup)
+    return Path(temp_dir.name)
+
 class TestUnifiedInstaller(unittest.TestCase):
     """Test the unified installer functionality"""
 
     def setUp(self):
         """Set up test environment"""
-        self.test_dir = Path(tempfile.mkdtemp())
+        self.test_dir = make_test_dir(self)
         self.installer = MCPInstaller()
         self.installer.repo_root = self.test_dir
         self.installer.mcp_base = self.test_dir / 'mcp_base'
 
-    def tearDown(self):
-        """Clean up test environment"""
-        shutil.rmtree(self.test_dir, ignore_errors=True)
-
     def test_unified_database_creation(self):
         """Test that mcp-unified.db is created correctly"""
         db_manager = DatabaseManager(self.installer.mcp_base)
@@ -182,12 +186,9 @@ class TestDatabaseManager(unittest.TestCase):
     """Test database manager functionality"""
 
     def setUp(self):
-        self.test_dir = Path(tempfile.mkdtemp())
+        self.test_dir = make_test_dir(self)
         self.db_manager = DatabaseManager(self.test_dir)
 
-    def tearDown(self):
-        shutil.rmtree(self.test_dir, ignore_errors=True)
-
     def test_all_databases_initialized(self):
         """Test that all required databases are created"""
         success = self.db_manager.initialize_all_databases()
@@ -214,15 +215,12 @@ class TestValidator(unittest.TestCase):
     """Test installation validator"""
 
     def setUp(self):
-        self.test_dir = Path(tempfile.mkdtemp())
+        self.test_dir = make_test_dir(self)
         self.config_paths = {
             'claude_desktop': self.test_dir / 'config.json'
         }
         self.validator = InstallationValidator(self.test_dir, self.config_paths)
 
-    def tearDown(self):
-        shutil.rmtree(self.test_dir, ignore_errors=True)
-
     def test_sqlite_config_validation(self):
         """Test SQLite configuration validation"""
         # Create a test config with correct SQLite pointing to unified DB
@@ -274,6 +272,82 @@ class TestValidator(unittest.TestCase):
         self.assertIn('INSTALL_PATH', claude_result, "Should detect [INSTALL_PATH] placeholder")
         self.assertIn('USERNAME', claude_result, "Should detect [USERNAME] placeholder")
 
+@unittest.skipIf(sys.platform == 'win32', "fake tools rely on POSIX executable bits")
+class TestPrerequisiteCache(unittest.TestCase):
+    """Test caching of prerequisite version checks"""
+
+    def setUp(self):
+        self.test_dir = make_test_dir(self)
+        self.validator = InstallationValidator(self.test_dir, {})
+        self.validator.prereq_cache_path = self.test_dir / 'prereq_cache.json'
+
+        # Stand-in node/npm/git binaries, alone on PATH
+        self.bin_dir = self.test_dir / 'bin'
+        self.bin_dir.mkdir()
+        for tool in ('node', 'npm', 'git'):
+            tool_path = self.bin_dir / tool
+            tool_path.touch()
+            tool_path.chmod(0o755)
+
+        env_patch = patch.dict(os.environ, {'PATH': str(self.bin_dir)})
+        env_patch.start()
+        self.addCleanup(env_patch.stop)
+
+        self.outcomes = {}
+        self.checked = []
+
+    def fake_version_check(self, command):
+        self.checked.append(command[0])
+        return self.outcomes.get(command[0], ('ok', f"{command[0]} 1.0"))
+
+    def run_prerequisites(self):
+        """Validate prerequisites, recording which tools were actually checked"""
+        self.checked = []
+        with patch.object(self.validator, '_run_version_check', side_effect=self.fake_version_check):
+            return self.validator.validate_prerequisites()
+
+    def test_unchanged_tools_are_cached(self):
+        """Test that a second run reuses cached results without checking again"""
+        first_passed, first_results = self.run_prerequisites()
+        self.assertEqual(sorted(self.checked), ['git', 'node', 'npm'])
+        self.assertTrue(self.validator.prereq_cache_path.exists(), "Cache should be written to the test dir")
+
+        passed, results = self.run_prerequisites()
+        self.assertEqual(self.checked, [], "Unchanged tools should not be checked again")
+        self.assertTrue(first_passed and passed)
+        self.assertEqual(results, first_results)
+
+    def test_binary_mtime_change_invalidates_entry(self):
+        """Test that replacing a binary re-checks only that tool"""
+        self.run_prerequisites()
+
+        node_path = self.bin_dir / 'node'
+        mtime = node_path.stat().st_mtime
+        os.utime(node_path, (mtime + 60, mtime + 60))
+
+        self.run_prerequisites()
+        self.assertEqual(self.checked, ['node'])
+
+    def test_path_change_invalidates_entries(self):
+        """Test that a different PATH re-checks every tool"""
+        self.run_prerequisites()
+
+        os.environ['PATH'] = os.pathsep.join([str(self.bin_dir), str(self.test_dir)])
+        self.run_prerequisites()
+        self.assertEqual(sorted(self.checked), ['git', 'node', 'npm'])
+
+    def test_failed_check_is_not_cached(self):
+        """Test that a failed check runs again on the next validation"""
+        self.outcomes['npm'] = ('failed', None)
+        passed, results = self.run_prerequisites()
+        self.assertFalse(passed)
+        self.assertIn('npm', self.checked)
+
+        passed, results = self.run_prerequisites()
+        self.assertEqual(self.checked, ['npm'], "Only the failed tool should be checked again")
+        self.assertFalse(passed)
+        self.assertEqual(results['npm'], "❌ Command failed")
+
 def run_comprehensive_tests():
     """Run comprehensive test suite"""
     print("🧪 Running MCP Federation Core Installation Tests")
@@ -287,6 +361,7 @@ def run_comprehensive_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestUnifiedInstaller))
     suite.addTests(loader.loadTestsFromTestCase(TestDatabaseManager))
     suite.addTests(loader.loadTestsFromTestCase(TestValidator))
+    suite.addTests(loader.loadTestsFromTestCase(TestPrerequisiteCache))
 
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
@@ -8,42 +8,44 @@ Preserves user's existing MCPs and configurations
 import os
 import sys
 import json
+import time
 import shutil
-import sqlite3
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Set
-from datetime import datetime
-import argparse
+
+# Define Federation-only MCPs (DO NOT REMOVE USER MCPs BY DEFAULT)
+# COMPLETE list of ALL 15 Federation MCPs with exact names as installed
+FEDERATION_MCPS = frozenset({
+    'sqlite',                        # SQLite data warehouse
+    'expert-role-prompt',            # Expert role prompting system
+    'kimi-k2-resilient-enhanced',    # Kimi K2 resilient processing
+    'kimi-k2-code-context-enhanced', # Kimi K2 code context
+    'rag-context',                   # RAG context management
+    'converse',                      # Converse provider
+    'web-search',                    # Web search capability
+    'github-manager',                # GitHub management
+    'memory',                        # Memory graph system
+    'filesystem',                    # File system access
+    'desktop-commander',             # Desktop commander
+    'perplexity',                    # Perplexity integration
+    'playwright',                    # Playwright browser automation
+    'git-ops',                       # Git operations
+    'sequential-thinking'            # Sequential thinking
+})
+
 
 class MCPFederationUninstaller:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.platform = self._detect_platform()
-        self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-        # Define Federation-only MCPs (DO NOT REMOVE USER MCPs BY DEFAULT)
-        # COMPLETE list of ALL 15 Federation MCPs with exact names as installed
-        self.FEDERATION_MCPS = [
-            'sqlite',                        # SQLite data warehouse
-            'expert-role-prompt',            # Expert role prompting system
-            'kimi-k2-resilient-enhanced',    # Kimi K2 resilient processing
-            'kimi-k2-code-context-enhanced', # Kimi K2 code context
-            'rag-context',                   # RAG context management
-            'converse',                      # Converse provider
-            'web-search',                    # Web search capability
-            'github-manager',                # GitHub management
-            'memory',                        # Memory graph system
-            'filesystem',                    # File system access
-            'desktop-commander',             # Desktop commander
-            'perplexity',                    # Perplexity integration
-            'playwright',                    # Playwright browser automation
-            'git-ops',                       # Git operations
-            'sequential-thinking'            # Sequential thinking
-        ]
+        self.timestamp = time.strftime("%Y%m%d_%H%M%S")
+
+        # Federation MCP names are shared by every instance
+        self.FEDERATION_MCPS = FEDERATION_MCPS
 
         # Total expected Federation MCPs
-        self.TOTAL_FEDERATION_MCPS = 15
+        self.TOTAL_FEDERATION_MCPS = len(FEDERATION_MCPS)
 
         # Define Federation-specific databases
         self.FEDERATION_DATABASES = [
@@ -89,6 +91,12 @@ class MCPFederationUninstaller:
                 'zed': home / '.config' / 'zed' / 'settings.json'
             }
 
+    def _write_config(self, config_path: Path, config: Dict) -> None:
+        """Serialize a config up front and swap it in atomically"""
+        tmp_path = config_path.with_suffix('.json.tmp')
+        tmp_path.write_text(json.dumps(config, indent=2))
+        os.replace(tmp_path, config_path)
+
     def backup_configurations(self) -> Dict[str, Path]:
         """Create backups of all configuration files"""
         print("\n[BACKUP] Creating configuration backups...")
@@ -101,7 +109,7 @@ class MCPFederationUninstaller:
             if config_path.exists():
                 backup_path = backup_dir / f"{app_name}_backup.json"
                 try:
-                    shutil.copy2(config_path, backup_path)
+                    shutil.copyfile(config_path, backup_path)
                     backups[app_name] = backup_path
                     print(f"  [OK] Backed up {app_name} configuration")
                 except Exception as e:
@@ -115,9 +123,9 @@ class MCPFederationUninstaller:
             'original_paths': {k: str(v) for k, v in self.config_paths.items()}
         }
 
+        # Only restore_from_backup reads the manifest, so keep it compact
         manifest_path = backup_dir / 'manifest.json'
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
+        manifest_path.write_text(json.dumps(manifest, separators=(',', ':')))
 
         print(f"\n[DIR] Backups saved to: {backup_dir}")
         return backups
@@ -147,18 +155,11 @@ class MCPFederationUninstaller:
                 config = json.load(f)
 
             mcp_servers = config.get('mcpServers', {})
-            removed_count = 0
-            preserved_count = 0
-
-            # Identify MCPs to remove - check exact matches
-            mcps_to_remove = []
-            for mcp_name in list(mcp_servers.keys()):
-                # Check if it's a Federation MCP (exact match)
-                if mcp_name in self.FEDERATION_MCPS:
-                    mcps_to_remove.append(mcp_name)
-                    removed_count += 1
-                else:
-                    preserved_count += 1
+
+            # Identify MCPs to remove - exact matches, O(1) each against the frozenset
+            mcps_to_remove = [name for name in mcp_servers if name in self.FEDERATION_MCPS]
+            removed_count = len(mcps_to_remove)
+            preserved_count = len(mcp_servers) - removed_count
 
             # Remove Federation MCPs
             for mcp_name in mcps_to_remove:
@@ -170,8 +171,7 @@ class MCPFederationUninstaller:
                 print(f"    [+] Preserved: {mcp_name}")
 
             # Save updated config
-            with open(config_path, 'w') as f:
-                json.dump(config, f, indent=2)
+            self._write_config(config_path, config)
 
             return removed_count, preserved_count
 
@@ -184,27 +184,33 @@ class MCPFederationUninstaller:
         print("\n[DATABASE] Removing Federation databases...")
 
         databases_dir = mcp_base / 'databases'
-        if not databases_dir.exists():
+
+        # One directory read instead of an exists() probe per database
+        try:
+            with os.scandir(databases_dir) as entries:
+                db_files = {entry.name: entry.path for entry in entries if entry.is_file()}
+        except FileNotFoundError:
             print("  [INFO] No databases directory found")
             return 0
 
         removed_count = 0
         for db_name in self.FEDERATION_DATABASES:
-            db_path = databases_dir / db_name
-            if db_path.exists():
+            db_path = db_files.get(db_name)
+            if db_path:
                 try:
                     os.remove(db_path)
+                    del db_files[db_name]
                     print(f"  [-] Removed: {db_name}")
                     removed_count += 1
                 except Exception as e:
                     print(f"  [WARN] Could not remove {db_name}: {e}")
 
         # Check for other databases (preserve them)
-        remaining_dbs = list(databases_dir.glob('*.db'))
+        remaining_dbs = [name for name in db_files if name.endswith('.db')]
         if remaining_dbs:
             print("\n  Preserved databases:")
-            for db in remaining_dbs:
-                print(f"    [+] {db.name}")
+            for db_name in remaining_dbs:
+                print(f"    [+] {db_name}")
 
         return removed_count
 
@@ -244,7 +250,7 @@ class MCPFederationUninstaller:
 
         return True
 
-    def complete_uninstall(self, mcp_base: Path) -> bool:
+    def complete_uninstall(self, mcp_base: Path, assume_yes: bool = False) -> bool:
         """Complete uninstall - removes ALL MCPs (use with caution)"""
         print("\n" + "="*70)
         print("[WARNING] COMPLETE UNINSTALL - This will remove ALL MCPs")
@@ -254,10 +260,11 @@ class MCPFederationUninstaller:
         print("  - ALL databases")
         print("  - ALL MCP-related files")
 
-        confirm = input("\nType 'REMOVE ALL' to confirm complete uninstall: ")
-        if confirm != 'REMOVE ALL':
-            print("[X] Complete uninstall cancelled")
-            return False
+        if not assume_yes:
+            confirm = input("\nType 'REMOVE ALL' to confirm complete uninstall: ")
+            if confirm != 'REMOVE ALL':
+                print("[X] Complete uninstall cancelled")
+                return False
 
         # Create backups
         backups = self.backup_configurations()
@@ -276,8 +283,7 @@ class MCPFederationUninstaller:
                         config['mcpServers'] = {}
                         print(f"  [-] Removed {mcp_count} MCPs")
 
-                    with open(config_path, 'w') as f:
-                        json.dump(config, f, indent=2)
+                    self._write_config(config_path, config)
 
                 except Exception as e:
                     print(f"  [WARN] Error: {e}")
@@ -298,24 +304,29 @@ class MCPFederationUninstaller:
 
         return True
 
-    def restore_from_backup(self, backup_dir: Optional[Path] = None) -> bool:
+    def restore_from_backup(self, backup_dir: Optional[Path] = None, assume_yes: bool = False) -> bool:
         """Restore configurations from backup"""
         print("\n" + "="*70)
         print("RESTORE FROM BACKUP")
         print("="*70)
 
-        # Find available backups
+        # List available backups with one directory read
         backups_root = Path.cwd() / 'uninstaller_backups'
-        if not backups_root.exists():
-            print("[X] No backups found")
-            return False
+        try:
+            with os.scandir(backups_root) as entries:
+                available_backups = sorted(Path(entry.path) for entry in entries if entry.is_dir())
+        except FileNotFoundError:
+            available_backups = []
 
-        # List available backups
-        available_backups = sorted(backups_root.glob('*'))
         if not available_backups:
             print("[X] No backups found")
             return False
 
+        if backup_dir is None and assume_yes:
+            # Backup directories are timestamped, so the last one is the newest
+            backup_dir = available_backups[-1]
+            print(f"\nUsing latest backup: {backup_dir.name}")
+
         if backup_dir is None:
             print("\nAvailable backups:")
             for i, backup in enumerate(available_backups, 1):
@@ -375,19 +386,13 @@ class MCPFederationUninstaller:
                 analysis['all_installed_mcps'].extend(installed_mcps)
 
         # Remove duplicates
-        analysis['all_installed_mcps'] = list(set(analysis['all_installed_mcps']))
+        installed = set(analysis['all_installed_mcps'])
+        analysis['all_installed_mcps'] = list(installed)
 
-        # Check each Federation MCP explicitly
-        for mcp_name in self.FEDERATION_MCPS:
-            if mcp_name in analysis['all_installed_mcps']:
-                analysis['federation_mcps_found'].append(mcp_name)
-            else:
-                analysis['federation_mcps_missing'].append(mcp_name)
-
-        # Find user MCPs (any not in Federation list)
-        for mcp in analysis['all_installed_mcps']:
-            if mcp not in self.FEDERATION_MCPS:
-                analysis['user_mcps_found'].append(mcp)
+        # Split Federation and user MCPs with set operations
+        analysis['federation_mcps_found'] = list(self.FEDERATION_MCPS & installed)
+        analysis['federation_mcps_missing'] = list(self.FEDERATION_MCPS - installed)
+        analysis['user_mcps_found'] = list(installed - self.FEDERATION_MCPS)
 
         analysis['total_federation_found'] = len(analysis['federation_mcps_found'])
         return analysis
@@ -495,6 +500,8 @@ class MCPFederationUninstaller:
 
 def main():
     """Main entry point"""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='Safe uninstaller for MCP Federation Core'
     )
@@ -523,6 +530,12 @@ def main():
         help='Skip confirmation prompts (dangerous!)'
     )
 
+    parser.add_argument(
+        '--yes', '-y',
+        action='store_true',
+        help='Answer prompts automatically for scripted runs (restore picks the latest backup)'
+    )
+
     args = parser.parse_args()
 
     # Setup logging
@@ -540,14 +553,11 @@ def main():
         if args.mode == 'selective':
             uninstaller.selective_uninstall(mcp_base)
         elif args.mode == 'complete':
-            if args.force:
-                # Skip confirmation in force mode
-                uninstaller.complete_uninstall(mcp_base)
-            else:
-                uninstaller.complete_uninstall(mcp_base)
+            # Skip confirmation in force or --yes mode
+            uninstaller.complete_uninstall(mcp_base, assume_yes=args.force or args.yes)
         elif args.mode == 'restore':
             backup_dir = Path(args.backup_dir) if args.backup_dir else None
-            uninstaller.restore_from_backup(backup_dir)
+            uninstaller.restore_from_backup(backup_dir, assume_yes=args.yes)
         elif args.mode == 'dry-run':
             uninstaller.dry_run(mcp_base)
     else:
@@ -33,12 +33,14 @@ show_help() {
     echo "  --mcp-base PATH    Path to mcp_base directory"
     echo "  --backup-dir PATH  Specific backup to restore"
     echo "  --force           Skip confirmation prompts"
+    echo "  --yes, -y         Answer prompts automatically (restore uses latest backup)"
     echo ""
     echo "Examples:"
     echo "  $0                         # Interactive mode"
     echo "  $0 selective               # Remove Federation only"
     echo "  $0 complete --force        # Remove everything, no prompts"
     echo "  $0 restore                 # Restore from backup"
+    echo "  $0 restore --yes           # Restore latest backup, no prompts"
     echo "  $0 dry-run                 # Preview changes"
     echo ""
 }
@@ -1,6 +1,7 @@
 """
 Ollama Manager - Auto-detection and management of Ollama models
 """
+import re
 import requests
 import logging
 from typing import List, Optional, Dict, Any
@@ -8,6 +9,12 @@ from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# Model-name keyword matchers: one case-insensitive scan per model instead of
+# lowercasing the name once per keyword
+CODE_MODEL_PATTERN = re.compile(r'code|coder', re.IGNORECASE)
+GENERAL_MODEL_PATTERN = re.compile(r'llama|qwen', re.IGNORECASE)
+VISION_MODEL_PATTERN = re.compile(r'vision|llava', re.IGNORECASE)
+
 
 class OllamaManager:
     """Manages Ollama model auto-detection and availability"""
@@ -252,17 +259,17 @@ class OllamaManager:
         if 'code' in task_type_lower or 'programming' in task_type_lower:
             # Prefer code models
             for model in self.available_models:
-                if 'code' in model.lower() or 'coder' in model.lower():
+                if CODE_MODEL_PATTERN.search(model):
                     return model
             # Fallback to general models
             for model in self.available_models:
-                if 'llama' in model.lower() or 'qwen' in model.lower():
+                if GENERAL_MODEL_PATTERN.search(model):
                     return model
 
         elif 'vision' in task_type_lower or 'image' in task_type_lower:
             # Prefer vision models
             for model in self.available_models:
-                if 'vision' in model.lower() or 'llava' in model.lower():
+                if VISION_MODEL_PATTERN.search(model):
                     return model
             return None  # No fallback for vision tasks
 
@@ -15,6 +15,11 @@ from pathlib import Path
 
 logger = logging.getLogger("dynamic-ollama-detection")
 
+# Compiled once at import; model properties are evaluated for every model on every scoring pass
+INSTRUCT_MODEL_PATTERN = re.compile(r'instruct|chat|it', re.IGNORECASE)
+CODE_MODEL_PATTERN = re.compile(r'code|coder|coding', re.IGNORECASE)
+SIZE_NUMBER_PATTERN = re.compile(r'(\d+\.?\d*)')
+
 @dataclass
 class OllamaModel:
     """Represents an available Ollama model"""
@@ -29,12 +34,12 @@ class OllamaModel:
     @property
     def is_instruct(self) -> bool:
         """Check if model is instruction-tuned"""
-        return any(keyword in self.name.lower() for keyword in ['instruct', 'chat', 'it'])
+        return INSTRUCT_MODEL_PATTERN.search(self.name) is not None
 
     @property
     def is_code_model(self) -> bool:
         """Check if model is specialized for coding"""
-        return any(keyword in self.name.lower() for keyword in ['code', 'coder', 'coding'])
+        return CODE_MODEL_PATTERN.search(self.name) is not None
 
     @property
     def size_bytes(self) -> int:
@@ -46,12 +51,12 @@ class OllamaModel:
         size_str = self.size.lower().replace(' ', '')
 
         if 'gb' in size_str:
-            return int(float(re.search(r'(\d+\.?\d*)', size_str).group(1)) * 1024**3)
+            return int(float(SIZE_NUMBER_PATTERN.search(size_str).group(1)) * 1024**3)
         elif 'mb' in size_str:
-            return int(float(re.search(r'(\d+\.?\d*)', size_str).group(1)) * 1024**2)
+            return int(float(SIZE_NUMBER_PATTERN.search(size_str).group(1)) * 1024**2)
         elif 'b' in size_str:
             # Billion parameters (approximate)
-            return int(float(re.search(r'(\d+\.?\d*)', size_str).group(1)) * 4 * 1024**3)
+            return int(float(SIZE_NUMBER_PATTERN.search(size_str).group(1)) * 4 * 1024**3)
 
         return 0
 
@@ -171,10 +176,11 @@ class OllamaDetector:
 
         for model in models:
             score = 0
+            name_lower = model.name.lower()
 
             # Family preference (highest weight)
             for i, family in enumerate(preferred_families):
-                if family in model.name.lower():
+                if family in name_lower:
                     score += (len(preferred_families) - i) * 10
                     break
 
@@ -10,12 +10,21 @@ THREE REMOVAL LEVELS: Config-only, data files, or complete removal
 import json
 import os
 import shutil
+import stat
+import subprocess
 from pathlib import Path
 import platform
-from datetime import datetime
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 class MCPUninstaller:
     def __init__(self):
+        self.system = platform.system()
+        self.is_windows = self.system == "Windows"
         self.home = Path.home()
         self.base_dir = self.home / "mcp-servers"
         self.config_path = self._get_config_path()
@@ -33,13 +42,39 @@ class MCPUninstaller:
 
     def _get_config_path(self):
         """Get the correct Claude Desktop config path for the OS"""
-        if platform.system() == "Windows":
+        if self.is_windows:
             return Path(os.environ.get('APPDATA', '')) / "Claude" / "claude_desktop_config.json"
-        elif platform.system() == "Darwin":  # macOS
+        elif self.system == "Darwin":  # macOS
             return self.home / "Library" / "Application Support" / "Claude" / "claude_desktop_config.json"
         else:  # Linux
             return self.home / ".config" / "Claude" / "claude_desktop_config.json"
 
+    def _fast_rmtree(self, *paths):
+        """
+        Remove directory trees with one call to the platform's native tool,
+        which is much faster than shutil.rmtree on node_modules-sized trees;
+        falls back to shutil.rmtree for anything the native removal left behind
+        """
+        if self.is_windows:
+            cmd = ['cmd', '/c', 'rmdir', '/s', '/q', *map(str, paths)]
+        else:
+            cmd = ['rm', '-rf', '--', *map(str, paths)]
+
+        try:
+            subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError:
+            pass
+
+        for path in paths:
+            if os.path.lexists(path):
+                shutil.rmtree(path)
+
+    def _write_config(self, data):
+        """Replace the Claude config atomically so it is never left half-written"""
+        temp_path = self.config_path.with_suffix('.json.tmp')
+        temp_path.write_bytes(data)
+        os.replace(temp_path, self.config_path)
+
     def load_installation_manifest(self):
         """Load installation manifest to identify what MCPs to remove safely"""
         if not self.manifest_path.exists():
@@ -77,20 +112,25 @@ class MCPUninstaller:
 
     def find_latest_backup(self):
         """Find the most recent backup file"""
-        if not self.backup_dir.exists():
-            return None
-
+        # scandir reports entry types from the directory read itself, and one
+        # stat per backup file both proves it exists and yields its mtime
         backups = []
-        for backup_folder in self.backup_dir.iterdir():
-            if backup_folder.is_dir():
-                backup_file = backup_folder / "claude_desktop_config.json"
-                if backup_file.exists():
-                    backups.append(backup_file)
+        try:
+            with os.scandir(self.backup_dir) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    backup_file = Path(entry.path) / "claude_desktop_config.json"
+                    try:
+                        backups.append((backup_file.stat().st_mtime, backup_file))
+                    except OSError:
+                        continue
+        except OSError:
+            return None
 
         if backups:
-            # Sort by modification time
-            backups.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-            return backups[0]
+            # Only the newest is needed, so a linear max beats a full sort
+            return max(backups, key=lambda backup: backup[0])[1]
 
         return None
 
@@ -105,10 +145,15 @@ class MCPUninstaller:
         # Load installation manifest
         manifest = self.load_installation_manifest()
 
+        # Nothing was newly installed, so there is nothing to parse or rewrite
+        if manifest and not manifest.get('newly_installed_mcps'):
+            print("  ℹ️  No federation MCPs found to remove")
+            return True
+
         try:
             # Load current config
-            with open(self.config_path, 'r') as f:
-                config = json.load(f)
+            data = self.config_path.read_bytes()
+            config = orjson.loads(data) if orjson is not None else json.loads(data)
 
             if 'mcpServers' not in config:
                 print("  ⚠️  No MCPs configured")
@@ -130,56 +175,58 @@ class MCPUninstaller:
                 print(f"  ❗ WARNING: Pre-existing MCPs with federation names may be removed")
 
             # Count MCPs before removal
-            before_count = len(config['mcpServers'])
-            removed = []
-            preserved = []
-            not_found = []
+            servers = config['mcpServers']
+            before_count = len(servers)
 
             # Process each MCP to remove
-            for mcp_name in mcps_to_remove:
-                if mcp_name in config['mcpServers']:
-                    del config['mcpServers'][mcp_name]
-                    removed.append(mcp_name)
-                    print(f"  ✓ Removed: {mcp_name}")
-                else:
-                    not_found.append(mcp_name)
-                    print(f"  ℹ️  Not found: {mcp_name}")
+            removed = [mcp_name for mcp_name in mcps_to_remove if mcp_name in servers]
+            # The report is collected and printed in one write at the end
+            report = [f"  ✓ Removed: {mcp_name}" if mcp_name in servers else f"  ℹ️  Not found: {mcp_name}"
+                      for mcp_name in mcps_to_remove]
+
+            # Rebuild mcpServers in one pass instead of deleting entries one by one
+            if removed:
+                remove_set = set(removed)
+                config['mcpServers'] = {name: server for name, server in servers.items()
+                                        if name not in remove_set}
 
             # Check for preserved pre-existing MCPs
-            if manifest:
-                for mcp_name in pre_existing:
-                    if mcp_name in config['mcpServers']:
-                        preserved.append(mcp_name)
-                        print(f"  🔒 PRESERVED: {mcp_name} (was pre-existing)")
+            preserved = [mcp_name for mcp_name in pre_existing if mcp_name in config['mcpServers']]
+            report.extend(f"  🔒 PRESERVED: {mcp_name} (was pre-existing)" for mcp_name in preserved)
 
             # Count MCPs after removal
             after_count = len(config['mcpServers'])
 
             # Save updated config if changes were made
             if removed:
-                with open(self.config_path, 'w', encoding='utf-8') as f:
-                    json.dump(config, f, indent=2)
+                if orjson is not None:
+                    data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+                else:
+                    data = json.dumps(config, indent=2).encode('utf-8')
+                self._write_config(data)
 
-                print(f"\n  📊 REMOVAL SUMMARY:")
-                print(f"     MCPs before: {before_count}")
-                print(f"     MCPs removed: {len(removed)}")
-                print(f"     MCPs preserved: {len(preserved)}")
-                print(f"     MCPs remaining: {after_count}")
+                report.extend([
+                    f"\n  📊 REMOVAL SUMMARY:",
+                    f"     MCPs before: {before_count}",
+                    f"     MCPs removed: {len(removed)}",
+                    f"     MCPs preserved: {len(preserved)}",
+                    f"     MCPs remaining: {after_count}"
+                ])
 
                 if preserved:
-                    print(f"\n  🔒 PRESERVED PRE-EXISTING MCPs:")
-                    for mcp in preserved:
-                        print(f"     ✓ {mcp}")
+                    report.append(f"\n  🔒 PRESERVED PRE-EXISTING MCPs:")
+                    report.extend(f"     ✓ {mcp}" for mcp in preserved)
 
                 # List all remaining MCPs
                 if after_count > 0:
-                    print(f"\n  💾 ALL REMAINING MCPs:")
-                    for mcp in config['mcpServers'].keys():
-                        status = "(pre-existing)" if mcp in preserved else "(user MCP)"
-                        print(f"     ✓ {mcp} {status}")
+                    report.append(f"\n  💾 ALL REMAINING MCPs:")
+                    preserved_set = set(preserved)
+                    report.extend(f"     ✓ {mcp} {'(pre-existing)' if mcp in preserved_set else '(user MCP)'}"
+                                  for mcp in config['mcpServers'])
             else:
-                print("  ℹ️  No federation MCPs found to remove")
+                report.append("  ℹ️  No federation MCPs found to remove")
 
+            print("\n".join(report))
             return True
 
         except Exception as e:
@@ -197,18 +244,17 @@ class MCPUninstaller:
 
         try:
             # Create safety backup of current state
-            safety_backup = self.config_path.parent / f"claude_desktop_config.uninstall_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            shutil.copy2(self.config_path, safety_backup)
+            safety_backup = self.config_path.parent / f"claude_desktop_config.uninstall_{time.strftime('%Y%m%d_%H%M%S')}.json"
+            shutil.copyfile(self.config_path, safety_backup)
             print(f"  📦 Safety backup: {safety_backup}")
 
-            # Restore from backup
-            shutil.copy2(backup, self.config_path)
+            # Restore from backup, checking the bytes parse before writing them
+            # so the count below needs no second read of the restored file
+            data = backup.read_bytes()
+            config = orjson.loads(data) if orjson is not None else json.loads(data)
+            self._write_config(data)
             print(f"  ✓ Restored from: {backup}")
 
-            # Verify restoration
-            with open(self.config_path, 'r') as f:
-                config = json.load(f)
-
             mcp_count = len(config.get('mcpServers', {}))
             print(f"  ✓ Verified: {mcp_count} MCPs in restored configuration")
 
@@ -232,11 +278,9 @@ class MCPUninstaller:
         for directory in directories_to_remove:
             if directory.exists():
                 try:
-                    # Count items before removal for reporting
                     if directory.is_dir():
-                        item_count = sum(1 for _ in directory.rglob('*'))
-                        shutil.rmtree(directory)
-                        print(f"  ✅ Removed: {directory} ({item_count} items)")
+                        self._fast_rmtree(directory)
+                        print(f"  ✅ Removed: {directory}")
                         removed_count += 1
                 except Exception as e:
                     print(f"  ⚠️  Could not remove {directory}: {e}")
@@ -269,20 +313,32 @@ class MCPUninstaller:
             self.base_dir / "kimi-k2-code-context-mcp-repo",
             self.base_dir / "kimi-k2-heavy-processor-mcp-repo",
             self.base_dir / "federation-wrappers",
+            self.base_dir / "deps_cache.json",  # Dependency fingerprints from the installer
             self.manifest_path  # Clean up the installation manifest too
         ]
 
-        cleaned_count = 0
+        # Split into files and directories so every tree goes in one removal
+        # call; a single lstat per item tells whether it exists and what it is
+        files = []
+        directories = []
         for item in items_to_clean:
-            if item.exists():
-                if item.is_file():
-                    item.unlink()
-                    print(f"  ✓ Removed file: {item.name}")
-                    cleaned_count += 1
-                elif item.is_dir():
-                    shutil.rmtree(item)
-                    print(f"  ✓ Removed directory: {item.name}")
-                    cleaned_count += 1
+            try:
+                mode = item.lstat().st_mode
+            except FileNotFoundError:
+                continue
+            (directories if stat.S_ISDIR(mode) else files).append(item)
+
+        cleaned_count = 0
+        for item in files:
+            item.unlink()
+            print(f"  ✓ Removed file: {item.name}")
+            cleaned_count += 1
+
+        if directories:
+            self._fast_rmtree(*directories)
+            for item in directories:
+                print(f"  ✓ Removed directory: {item.name}")
+                cleaned_count += 1
 
         print(f"  ✅ Federation cleanup complete: {cleaned_count} items removed")
 
@@ -391,16 +391,20 @@ class FederationUninstaller:
         # Check if base directory is empty
         if self.base_dir.exists():
             # Keep logs and backups
-            keep_dirs = ['safety_backups', 'database_backups', 'backup']
-
-            for item in self.base_dir.iterdir():
-                if item.is_dir() and item.name not in keep_dirs:
-                    if not any(item.iterdir()):  # If empty
-                        try:
-                            item.rmdir()
-                            print(f"  Removed empty directory: {item.name}")
-                        except:
-                            pass
+            keep_dirs = {'safety_backups', 'database_backups', 'backup'}
+
+            with os.scandir(self.base_dir) as entries:
+                candidates = [entry for entry in entries
+                              if entry.name not in keep_dirs and entry.is_dir()]
+
+            # rmdir only succeeds on empty directories, so it doubles as the
+            # emptiness check without listing each directory first
+            for entry in candidates:
+                try:
+                    os.rmdir(entry.path)
+                    print(f"  Removed empty directory: {entry.name}")
+                except OSError:
+                    pass
 
     def display_summary(self):
         """Display uninstallation summary"""
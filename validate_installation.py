@@ -7,7 +7,6 @@ Verifies that all 15 MCPs are correctly installed and configured
 import json
 import os
 import sys
-import subprocess
 import platform
 from pathlib import Path
 
@@ -126,17 +125,8 @@ class InstallationValidator:
             if not args:
                 issues.append("NPX command missing package argument")
 
-        # For global commands
-        else:
-            # Check if command exists in PATH
-            try:
-                check_cmd = ['where' if self.is_windows else 'which', command]
-                result = subprocess.run(check_cmd, capture_output=True, text=True, shell=False)
-                if result.returncode != 0:
-                    # May be installed but not in PATH yet
-                    pass  # Don't report as error
-            except:
-                pass
+        # Global commands are not checked: they may be installed but not in
+        # PATH yet, so a failed lookup is never reported as an error
 
         return issues
 
@@ -52,13 +52,12 @@ def check_mcp_server(name, config, base_dir):
     print(f"  Directory: {mcp_dir}")
     print(f"  Entry point: {entry_path}")
     
-    if not entry_path.exists():
+    # Read the entry point once; every check below works on this content
+    try:
+        content = entry_path.read_text(encoding='utf-8')
+    except FileNotFoundError:
         print(f"  ❌ Entry point not found: {entry_path}")
         return False
-    
-    # Check for test code
-    with open(entry_path, 'r', encoding='utf-8') as f:
-        content = f.read()
         
     # Check for correct indicator
     if config["test_indicator"] in content:
@@ -11,6 +11,8 @@ from pathlib import Path
 import platform
 import sys
 import time
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 
 class MCPVerifier:
     def __init__(self):
@@ -19,6 +21,12 @@ class MCPVerifier:
         self.results = {}
         self.platform = platform.system()
 
+        # Tool availability probes (e.g. 'npx --version') shared by many MCPs,
+        # as one Future per command so concurrent tests wait on a single run
+        # (failures included) instead of each probing again
+        self.command_checks = {}
+        self.command_checks_lock = threading.Lock()
+
     def _get_config_path(self):
         """Get the correct Claude Desktop config path for the OS"""
         if platform.system() == "Windows":
@@ -75,15 +83,9 @@ class MCPVerifier:
             # Unknown command type
             return {'status': 'unknown', 'message': f"Unknown command type: {command}"}
 
-        # Execute test command
+        # Execute test command - once per distinct command, most MCPs share one
         try:
-            result = subprocess.run(
-                test_cmd,
-                capture_output=True,
-                text=True,
-                timeout=5,
-                shell=(self.platform == "Windows")
-            )
+            result = self._probe_command(tuple(test_cmd))
 
             if result.returncode == 0:
                 # Now test the actual MCP if it's npx
@@ -120,6 +122,29 @@ class MCPVerifier:
         except Exception as e:
             return {'status': 'error', 'message': str(e)}
 
+    def _probe_command(self, test_cmd):
+        """Run a tool probe once; later callers get the same result or exception"""
+        with self.command_checks_lock:
+            future = self.command_checks.get(test_cmd)
+            owner = future is None
+            if owner:
+                future = self.command_checks[test_cmd] = Future()
+
+        # The probe itself runs outside the lock so different commands overlap
+        if owner:
+            try:
+                future.set_result(subprocess.run(
+                    list(test_cmd),
+                    capture_output=True,
+                    text=True,
+                    timeout=5,
+                    shell=(self.platform == "Windows")
+                ))
+            except Exception as e:
+                future.set_exception(e)
+
+        return future.result()
+
     def verify_all_mcps(self):
         """Verify all MCPs in the configuration"""
         print("\n" + "="*70)
@@ -148,31 +173,34 @@ class MCPVerifier:
             'timeout': 0
         }
 
-        # Test each MCP
-        for i, (name, mcp_config) in enumerate(mcpServers.items(), 1):
-            print(f"[{i}/{len(mcpServers)}] Testing {name}...")
-
-            result = self.test_mcp_command(name, mcp_config)
-            self.results[name] = result
-
-            # Update stats
-            stats[result['status']] = stats.get(result['status'], 0) + 1
-
-            # Display result with appropriate symbol
-            if result['status'] == 'ok':
-                symbol = "[OK]"
-            elif result['status'] == 'exists':
-                symbol = "[EXISTS]"
-            elif result['status'] == 'missing':
-                symbol = "[MISSING]"
-            elif result['status'] == 'error':
-                symbol = "[ERROR]"
-            elif result['status'] == 'timeout':
-                symbol = "[TIMEOUT]"
-            else:
-                symbol = "[UNKNOWN]"
+        # Each test mostly waits on npm/npx subprocesses, so run them side by
+        # side; map() hands the results back in config order for reporting
+        with ThreadPoolExecutor(max_workers=min(8, len(mcpServers))) as executor:
+            results = executor.map(self.test_mcp_command, mcpServers.keys(), mcpServers.values())
+
+            # Report in config order as results come in
+            for i, (name, result) in enumerate(zip(mcpServers, results), 1):
+                print(f"[{i}/{len(mcpServers)}] Testing {name}...")
+                self.results[name] = result
+
+                # Update stats
+                stats[result['status']] = stats.get(result['status'], 0) + 1
+
+                # Display result with appropriate symbol
+                if result['status'] == 'ok':
+                    symbol = "[OK]"
+                elif result['status'] == 'exists':
+                    symbol = "[EXISTS]"
+                elif result['status'] == 'missing':
+                    symbol = "[MISSING]"
+                elif result['status'] == 'error':
+                    symbol = "[ERROR]"
+                elif result['status'] == 'timeout':
+                    symbol = "[TIMEOUT]"
+                else:
+                    symbol = "[UNKNOWN]"
 
-            print(f"    {symbol} {name}: {result['message']}")
+                print(f"    {symbol} {name}: {result['message']}")
 
         # Display summary
         print("\n" + "="*70)